@@ -19,21 +19,24 @@ def run_cli(show_all: bool = False):
         # Create analyzer
         analyzer = PathAnalyzer()
 
-        # Print system information header
-        print(analyzer.format_system_info_header())
+        # Collect all output and write it in one call instead of one per section
+        # System information header
+        output = [analyzer.format_system_info_header()]
 
-        # Print PATH entries (limit to 20 unless show_all is True)
+        # PATH entries (limit to 20 unless show_all is True)
         limit = None if show_all else 20
-        print(analyzer.format_path_list(limit=limit))
+        output.append(analyzer.format_path_list(limit=limit))
 
-        # Print summary for Windows
+        # Summary for Windows
         if analyzer.is_windows():
-            print(f"\nPath Summary:")
+            output.append(f"\nPath Summary:")
             user_count = len(analyzer.get_user_path())
             system_count = len(analyzer.get_system_path())
             combined_count = analyzer.get_entry_count()
-            print(f"  User PATH entries: {user_count:<8}System PATH entries: {system_count:<8}Combined PATH entries: {combined_count}")
-            print(f"\nLegend: [U] = User PATH, [S] = System PATH")
+            output.append(f"  User PATH entries: {user_count:<8}System PATH entries: {system_count:<8}Combined PATH entries: {combined_count}")
+            output.append(f"\nLegend: [U] = User PATH, [S] = System PATH")
+
+        sys.stdout.write("\n".join(output) + "\n")
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
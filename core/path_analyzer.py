@@ -9,18 +9,119 @@ providing structured data for both CLI and GUI interfaces.
 import os
 import platform
 import socket
+import stat
+import time
+from collections import defaultdict
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 
+try:
+    import winreg
+except ImportError:
+    # Not on Windows
+    winreg = None
+
+if winreg is not None:
+    _HKCU = winreg.HKEY_CURRENT_USER
+    _HKLM = winreg.HKEY_LOCAL_MACHINE
+    _KEY_READ = winreg.KEY_READ
+
+# Registry PATH values are effectively stable over a few seconds, so repeated
+# PathAnalyzer constructions reuse the last read instead of reopening keys
+_REGISTRY_CACHE_TTL = 2.0  # seconds
+_WIN_PATH_CACHE = {"ts": 0.0, "user": None, "system": None}
+
+# System information doesn't change while the process runs, so look it up
+# once at import instead of on every PathAnalyzer construction
+_OS_NAME = platform.system()
+_OS_VERSION = platform.release()
+_HARDWARE = platform.machine()
+_HOSTNAME = socket.gethostname()
+_PATHSEP = os.pathsep
+
+# Rules framing the CLI header and PATH list
+_HEADER_RULE = '=' * 60
+_LIST_RULE = '#' * 20
+
+# Listing a parent directory can only beat per-entry stats where stat is
+# expensive: on Windows os.stat opens a handle per path, while scandir gets
+# each entry's attributes from the listing itself. On POSIX a warm stat is
+# cheaper than building DirEntry objects, so entries are always stat-ed.
+_SCANDIR_BATCHING = os.name == "nt"
+# Even on Windows, a parent (e.g. System32) is only listed when at least
+# this many distinct PATH entries live directly inside it
+_MIN_SCANDIR_CHILDREN = 8
+
+# Trailing separators to strip before splitting an entry into parent/name
+_SEPARATORS = os.sep + (os.altsep or "")
+
+
+def _parse_path_string(path_string: str) -> List[str]:
+    """Split a PATH string on the OS separator, dropping empty entries"""
+    return [p for p in path_string.split(_PATHSEP) if p]
+
+
+def _stat_path(path: str) -> Tuple[bool, bool]:
+    """Return (exists, is_dir) for a path from a single stat call"""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return False, False
+    return True, stat.S_ISDIR(st.st_mode)
+
+
+def _check_parent_group(group: Tuple[str, Dict[str, List[int]], List[str]]) -> List[Tuple[int, bool, bool]]:
+    """
+    Resolve existence for every PATH entry sharing one parent directory.
+
+    Returns (position, exists, is_dir) triples for the positions listed in
+    the group.
+    """
+    parent, children, paths = group
+    try:
+        with os.scandir(parent) as it:
+            present = {os.path.normcase(e.name): e for e in it}
+    except (FileNotFoundError, NotADirectoryError):
+        # Parent is gone, so none of its children can exist
+        return [(position, False, False) for positions in children.values() for position in positions]
+    except OSError:
+        # Parent exists but can't be listed (e.g. permissions)
+        return [(position, *_stat_path(paths[position]))
+                for positions in children.values() for position in positions]
+
+    results = []
+    for name, positions in children.items():
+        dir_entry = present.get(name)
+        for position in positions:
+            path = paths[position]
+            if (dir_entry is None or dir_entry.is_symlink()
+                    or (path[-1] in _SEPARATORS and not dir_entry.is_dir())):
+                # Not listed (e.g. case-insensitive filesystem), a link that
+                # may dangle, or a trailing separator on a non-directory
+                # (which stat rejects): confirm with a real stat
+                results.append((position, *_stat_path(path)))
+            else:
+                # DirEntry caches the file type from the listing itself
+                results.append((position, True, dir_entry.is_dir()))
+    return results
+
 
 class PathEntry:
     """Represents a single PATH entry with metadata"""
 
-    def __init__(self, path: str, index: int, source: str = "environment"):
+    # One instance per PATH element; slots avoid a per-instance __dict__
+    __slots__ = ("path", "index", "source", "exists", "is_dir")
+
+    def __init__(self, path: str, index: int, source: str = "environment",
+                 exists: Optional[bool] = None, is_dir: Optional[bool] = None):
         self.path = path
         self.index = index
         self.source = source  # "user", "system", or "environment"
-        self.exists = os.path.exists(path)
+        # Existence and type are normally pre-computed in bulk by PathAnalyzer
+        if exists is None:
+            exists, is_dir = _stat_path(path)
+        self.exists = exists
+        self.is_dir = bool(is_dir)
 
     def __repr__(self):
         return f"PathEntry(index={self.index}, path='{self.path}', source='{self.source}', exists={self.exists})"
@@ -35,11 +136,19 @@ class PathAnalyzer:
     """
 
     def __init__(self):
-        self.os_name = platform.system()
-        self.os_version = platform.release()
-        self.hardware = platform.machine()
-        self.machine_name = socket.gethostname()
-        self.separator = os.pathsep  # ';' on Windows, ':' on Unix
+        self.os_name = _OS_NAME
+        self.os_version = _OS_VERSION
+        self.hardware = _HARDWARE
+        self.machine_name = _HOSTNAME
+        self.separator = _PATHSEP  # ';' on Windows, ':' on Unix
+
+        # Static part of get_system_info(), built once per analyzer
+        self._system_info = {
+            "machine_name": self.machine_name,
+            "os_name": self.os_name,
+            "os_version": self.os_version,
+            "hardware": self.hardware,
+        }
 
         # Storage for PATH entries
         self.user_path: List[str] = []
@@ -50,6 +159,22 @@ class PathAnalyzer:
         # Load PATH data
         self._load_path()
 
+    def refresh(self):
+        """Re-read PATH from its sources, bypassing cached registry values"""
+        self.invalidate_cache()
+        self.user_path = []
+        self.system_path = []
+        self.combined_path = []
+        self.entries = []
+        self._load_path()
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Discard cached registry PATH values so the next load re-reads them"""
+        _WIN_PATH_CACHE["ts"] = 0.0
+        _WIN_PATH_CACHE["user"] = None
+        _WIN_PATH_CACHE["system"] = None
+
     def _load_path(self):
         """Load PATH from appropriate source based on OS"""
         if self.os_name == "Windows":
@@ -57,6 +182,10 @@ class PathAnalyzer:
         else:
             self._load_unix_path()
 
+    def _parse_env_path(self) -> List[str]:
+        """Parse the PATH environment variable into a list of entries"""
+        return _parse_path_string(os.environ.get('PATH', ''))
+
     def _load_windows_path(self):
         """
         Load PATH from Windows registry (User and System) and environment.
@@ -66,69 +195,116 @@ class PathAnalyzer:
         - System PATH: HKEY_LOCAL_MACHINE\\SYSTEM\\CurrentControlSet\\Control\\Session Manager\\Environment
         - The environment variable combines both (System + User typically)
         """
-        try:
-            import winreg
-
+        if winreg is None:
+            # winreg not available (not on Windows), fall back to environment
+            self._load_unix_path()
+            return
+
+        cache = _WIN_PATH_CACHE
+        now = time.monotonic()
+        if (now - cache["ts"] < _REGISTRY_CACHE_TTL
+                and cache["user"] is not None and cache["system"] is not None):
+            # Copy so callers can't mutate the cached lists
+            self.user_path = list(cache["user"])
+            self.system_path = list(cache["system"])
+        else:
             # Try to read User PATH from registry
             try:
-                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Environment", 0, winreg.KEY_READ) as key:
+                with winreg.OpenKey(_HKCU, r"Environment", 0, _KEY_READ) as key:
                     user_path_string, _ = winreg.QueryValueEx(key, "Path")
-                    self.user_path = [p for p in user_path_string.split(self.separator) if p]
+                    self.user_path = _parse_path_string(user_path_string)
             except (WindowsError, FileNotFoundError):
                 self.user_path = []
 
             # Try to read System PATH from registry (requires read access, not admin)
             try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                with winreg.OpenKey(_HKLM,
                                    r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment",
-                                   0, winreg.KEY_READ) as key:
+                                   0, _KEY_READ) as key:
                     system_path_string, _ = winreg.QueryValueEx(key, "Path")
-                    self.system_path = [p for p in system_path_string.split(self.separator) if p]
+                    self.system_path = _parse_path_string(system_path_string)
             except (WindowsError, FileNotFoundError):
                 self.system_path = []
 
-            # Get the actual combined PATH from environment
-            env_path = os.environ.get('PATH', '')
-            self.combined_path = [p for p in env_path.split(self.separator) if p]
-
-            # Create PathEntry objects
-            # Mark entries as user or system based on registry data
-            index = 0
-            for path in self.combined_path:
-                # Determine source (this is approximate since combined PATH may have been modified)
-                source = "environment"
-                if path in self.system_path:
-                    source = "system"
-                elif path in self.user_path:
-                    source = "user"
-
-                entry = PathEntry(path, index, source)
-                self.entries.append(entry)
-                index += 1
-
-        except ImportError:
-            # winreg not available (not on Windows), fall back to environment
-            self._load_unix_path()
+            cache["ts"] = now
+            cache["user"] = list(self.user_path)
+            cache["system"] = list(self.system_path)
+
+        # Get the actual combined PATH from environment
+        self.combined_path = self._parse_env_path()
+
+        # Create PathEntry objects
+        # Mark entries as user or system based on registry data
+        system_set = set(self.system_path)
+        user_set = set(self.user_path)
+        status_list = self._check_existence(self.combined_path)
+        for index, path in enumerate(self.combined_path):
+            # Determine source (this is approximate since combined PATH may have been modified)
+            source = "environment"
+            if path in system_set:
+                source = "system"
+            elif path in user_set:
+                source = "user"
+
+            exists, is_dir = status_list[index]
+            entry = PathEntry(path, index, source, exists=exists, is_dir=is_dir)
+            self.entries.append(entry)
 
     def _load_unix_path(self):
         """Load PATH from environment variable (Unix-like systems)"""
-        env_path = os.environ.get('PATH', '')
-        self.combined_path = [p for p in env_path.split(self.separator) if p]
+        self.combined_path = self._parse_env_path()
 
         # Create PathEntry objects
+        status_list = self._check_existence(self.combined_path)
         for index, path in enumerate(self.combined_path):
-            entry = PathEntry(path, index, "environment")
+            exists, is_dir = status_list[index]
+            entry = PathEntry(path, index, "environment", exists=exists, is_dir=is_dir)
             self.entries.append(entry)
 
+    def _check_existence(self, paths: List[str]) -> List[Tuple[bool, bool]]:
+        """
+        Check which PATH entries exist on disk and which are directories.
+
+        Entries are stat-ed one by one. On Windows, a parent directory that
+        holds several entries is instead listed once with scandir, which
+        answers for all of them.
+        """
+        if not _SCANDIR_BATCHING:
+            return [_stat_path(path) for path in paths]
+
+        # Map parent -> {normalized child name: [positions in paths]}
+        parents = defaultdict(dict)
+        results: List[Optional[Tuple[bool, bool]]] = [None] * len(paths)
+
+        for position, path in enumerate(paths):
+            stripped = path.rstrip(_SEPARATORS)
+            parent, name = os.path.split(stripped)
+            if not parent or name in ("", ".", ".."):
+                # Relative entries and drive/filesystem roots can't be
+                # answered from a parent listing
+                results[position] = _stat_path(path)
+                continue
+            parents[parent].setdefault(os.path.normcase(name), []).append(position)
+
+        for parent, children in parents.items():
+            if len(children) < _MIN_SCANDIR_CHILDREN:
+                # Listing a whole directory (e.g. System32) to answer for a
+                # few names costs more than stat-ing them directly
+                for positions in children.values():
+                    for position in positions:
+                        results[position] = _stat_path(paths[position])
+                continue
+            for position, exists, is_dir in _check_parent_group((parent, children, paths)):
+                results[position] = (exists, is_dir)
+
+        return results
+
     def get_system_info(self) -> Dict[str, str]:
         """Get system information as a dictionary"""
-        return {
-            "machine_name": self.machine_name,
-            "os_name": self.os_name,
-            "os_version": self.os_version,
-            "hardware": self.hardware,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        }
+        info = dict(self._system_info)
+        # Only the timestamp changes between calls
+        info["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return info
 
     def get_path_entries(self) -> List[PathEntry]:
         """Get all PATH entries as PathEntry objects"""
@@ -158,16 +334,18 @@ class PathAnalyzer:
         """Format system information as a compact text header"""
         from core import __version__
         info = self.get_system_info()
-        header = f"{'=' * 60}\n"
-        header += f"PathManager - System Information    [ v{__version__} ]\n"
-        header += f"{'=' * 60}\n"
-        # Compact two-column format
-        header += f"Machine Name: {info['machine_name']:<20}Operating System: {info['os_name']} {info['os_version']}\n"
-        header += f"Hardware: {info['hardware']:<24}Date: {info['timestamp']}\n"
-        header += f"{'=' * 60}\n"
-        return header
-
-    def format_path_list(self, limit: int = None) -> str:
+        parts = [
+            _HEADER_RULE,
+            f"PathManager - System Information    [ v{__version__} ]",
+            _HEADER_RULE,
+            # Compact two-column format
+            f"Machine Name: {info['machine_name']:<20}Operating System: {info['os_name']} {info['os_version']}",
+            f"Hardware: {info['hardware']:<24}Date: {info['timestamp']}",
+            _HEADER_RULE,
+        ]
+        return "\n".join(parts) + "\n"
+
+    def format_path_list(self, limit: Optional[int] = None) -> str:
         """
         Format PATH entries as numbered list
 
@@ -175,14 +353,19 @@ class PathAnalyzer:
             limit: Maximum number of entries to display (None = all entries)
         """
         total_count = self.get_entry_count()
-        display_count = min(limit, total_count) if limit else total_count
+        # Truncate before formatting so hidden rows are never built
+        entries = self.entries[:limit] if limit else self.entries
+        display_count = len(entries)
 
-        output = f"{'#' * 20}\n"
-        output += f"System PATH Entries ({total_count} total)\n"
-        output += f"{'#' * 20}\n\n"
+        parts = [
+            _LIST_RULE,
+            f"System PATH Entries ({total_count} total)",
+            _LIST_RULE,
+            "",
+        ]
 
         # Display entries up to the limit
-        for entry in self.entries[:display_count]:
+        for entry in entries:
             # Add source indicator for Windows
             source_indicator = ""
             if self.is_windows() and entry.source != "environment":
@@ -191,10 +374,11 @@ class PathAnalyzer:
             # Add existence indicator
             exists_indicator = "" if entry.exists else " [NOT FOUND]"
 
-            output += f"{entry.index + 1:02d} | {entry.path}{source_indicator}{exists_indicator}\n"
+            parts.append(f"{entry.index + 1:02d} | {entry.path}{source_indicator}{exists_indicator}")
 
         # Add message if list was truncated
         if limit and total_count > limit:
-            output += f"\n[ showing first {display_count} of {total_count} PATH entries ]\n"
+            parts.append("")
+            parts.append(f"[ showing first {display_count} of {total_count} PATH entries ]")
 
-        return output
+        return "\n".join(parts) + "\n"
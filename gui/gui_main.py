@@ -7,34 +7,322 @@ PyQt6-based GUI for viewing and managing PATH.
 import sys
 import os
 import platform
-from datetime import datetime
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QTableWidget, QTableWidgetItem,
+    QApplication, QMainWindow, QTableView,
     QVBoxLayout, QWidget, QStatusBar, QHeaderView, QLabel, QHBoxLayout,
-    QMenuBar, QMessageBox, QLineEdit, QPushButton, QFrame, QDialog, QTextEdit
+    QMessageBox, QLineEdit, QPushButton, QFrame, QDialog, QTextEdit,
+    QStyledItemDelegate
 )
-from PyQt6.QtCore import Qt, QSettings
-from PyQt6.QtGui import QColor, QFont, QAction, QKeySequence, QShortcut
+from PyQt6.QtCore import Qt, QSettings, QTimer, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QBrush, QColor, QFont, QAction, QKeySequence, QShortcut, QPalette
 from core.path_analyzer import PathAnalyzer
 
+# Project root directory (where pathmanager.py and the docs live)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Table colors, built once instead of on every data() call
+_CLR_SYSTEM_BG = QColor(0, 60, 120)           # Dark blue background
+_CLR_USER_BG = QColor(0, 100, 0)              # Dark green background
+_CLR_SOURCE_FG = QColor(245, 245, 250)        # Off-white text
+_CLR_ENVIRONMENT_FG = QColor(160, 160, 160)   # Light gray text
+_CLR_OK = QColor(0, 128, 0)                   # Green
+_CLR_BAD = QColor(255, 0, 0)                  # Red
+_CLR_HIGHLIGHT_BG = QColor(128, 128, 128)     # Medium grey background
+_CLR_CUR_MATCH_BG = QColor(80, 80, 80)        # Dark grey background for current match
+_CLR_WHITE = QColor(255, 255, 255)            # White text
+
+_BRUSH_SYSTEM_BG = QBrush(_CLR_SYSTEM_BG)
+_BRUSH_USER_BG = QBrush(_CLR_USER_BG)
+
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+# Application-wide stylesheet, parsed once in run_gui(); widgets opt in by
+# object name instead of each carrying its own stylesheet
+_QSS = """
+QLabel#systemInfo {
+    color: gray;
+}
+QLabel#versionLabel {
+    color: #888888;
+    font-size: 9pt;
+}
+QFrame#searchBar, QFrame#searchBar QFrame {
+    background-color: #e8e8e8;
+    padding: 5px;
+}
+QFrame#searchBar QLabel {
+    color: #000000;
+}
+QFrame#searchBar QLabel#searchLabel {
+    color: #000000;
+    font-weight: bold;
+}
+QFrame#searchBar QLabel#matchLabel {
+    color: #666666;
+    margin-left: 10px;
+}
+QLineEdit#searchInput {
+    background-color: white;
+    color: black;
+    border: 1px solid #cccccc;
+    padding: 5px;
+    border-radius: 3px;
+}
+QPushButton#navButton {
+    background-color: #4CAF50;
+    color: white;
+    border: none;
+    padding: 5px 15px;
+    border-radius: 3px;
+}
+QPushButton#navButton:hover {
+    background-color: #45a049;
+}
+QPushButton#navButton:pressed {
+    background-color: #3d8b40;
+}
+QPushButton#closeButton {
+    background-color: #f44336;
+    color: white;
+    border: none;
+    padding: 5px;
+    border-radius: 3px;
+    font-weight: bold;
+}
+QPushButton#closeButton:hover {
+    background-color: #da190b;
+}
+QPushButton#closeButton:pressed {
+    background-color: #c41408;
+}
+"""
+
+# Delay after the last keystroke before the search runs (milliseconds)
+SEARCH_DEBOUNCE_MS = 50
+
+
+class PathTableModel(QAbstractTableModel):
+    """
+    Table model serving PATH entries to a QTableView.
+
+    Cell text, colors and alignment are computed on demand in data(),
+    so only the cells Qt actually paints are ever formatted.
+    """
+
+    PATH_COLUMN = 1
+
+    def __init__(self, analyzer: PathAnalyzer, parent=None):
+        super().__init__(parent)
+        self._is_windows = analyzer.is_windows()
+        if self._is_windows:
+            self._columns = ["#", "Path", "Source", "Status"]
+        else:
+            self._columns = ["#", "Path", "Status"]
+
+        self._entries = []
+        self._search_index = []
+        self._missing_count = 0
+
+        # Search highlighting state for the Path column
+        self._match_rows = set()
+        self._current_match_row = -1
+
+        self.set_entries(analyzer.get_path_entries())
+
+    def set_entries(self, entries):
+        """Replace the displayed entries and reset search highlighting"""
+        self.beginResetModel()
+        self._entries = entries
+        # Casefolded once here so searches don't re-fold every path per keystroke
+        self._search_index = [entry.path.casefold() for entry in entries]
+        # Counted once here so the status bar doesn't re-walk the entries
+        self._missing_count = sum(1 for entry in entries if not entry.exists)
+        self._match_rows = set()
+        self._current_match_row = -1
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of PATH entries (flat table, so no children)"""
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Number of columns for the current OS"""
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Provide column titles for the horizontal header"""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Return cell data for the requested role"""
+        if not index.isValid():
+            return None
+
+        entry = self._entries[index.row()]
+        column = self._columns[index.column()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == "#":
+                return str(entry.index + 1)
+            if column == "Path":
+                return entry.path
+            if column == "Source":
+                return entry.source.capitalize()
+            return "✓ OK" if entry.exists else "✗ Not Found"
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column != "Path":
+                return _ALIGN_CENTER
+            return None
+
+        # Source and Status colors are painted by PathItemDelegate from the
+        # raw entry, so only the Path column's search highlight is served here
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if column == "Path":
+                if index.row() == self._current_match_row:
+                    return _CLR_CUR_MATCH_BG
+                if index.row() in self._match_rows:
+                    return _CLR_HIGHLIGHT_BG
+            return None
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == "Path" and index.row() in self._match_rows:
+                return _CLR_WHITE
+            return None
+
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+
+        return None
+
+    def column_for(self, title: str) -> int:
+        """Column number for a header title, or -1 if not shown on this OS"""
+        return self._columns.index(title) if title in self._columns else -1
+
+    def missing_count(self) -> int:
+        """Number of entries whose directory doesn't exist"""
+        return self._missing_count
+
+    def find_rows(self, search_text: str):
+        """Return rows whose path contains search_text (case-insensitive)"""
+        # QAbstractItemModel.match() would call back into the Python data()
+        # for every row; scanning the prebuilt index directly is much faster
+        needle = search_text.casefold()
+        return [row for row, haystack in enumerate(self._search_index) if needle in haystack]
+
+    def set_search_matches(self, rows):
+        """Highlight the given rows in the Path column"""
+        new_rows = set(rows)
+        # Only rows entering or leaving the highlight need repainting
+        changed = self._match_rows ^ new_rows
+        if self._current_match_row >= 0:
+            changed.add(self._current_match_row)
+        self._match_rows = new_rows
+        self._current_match_row = -1
+        self._emit_path_rows_changed(changed)
+
+    def set_current_match(self, row: int):
+        """Mark a single matching row as the current match (-1 for none)"""
+        changed = {r for r in (self._current_match_row, row) if r >= 0}
+        self._current_match_row = row
+        self._emit_path_rows_changed(changed)
+
+    def _emit_path_rows_changed(self, rows):
+        """Tell attached views that Path column colors changed for these rows"""
+        roles = [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole]
+        # One signal per contiguous run of rows
+        run_start = run_end = None
+        for row in sorted(rows):
+            if run_end is not None and row == run_end + 1:
+                run_end = row
+                continue
+            if run_start is not None:
+                self.dataChanged.emit(self.index(run_start, self.PATH_COLUMN),
+                                      self.index(run_end, self.PATH_COLUMN), roles)
+            run_start = run_end = row
+        if run_start is not None:
+            self.dataChanged.emit(self.index(run_start, self.PATH_COLUMN),
+                                  self.index(run_end, self.PATH_COLUMN), roles)
+
+
+class PathItemDelegate(QStyledItemDelegate):
+    """
+    Paints the Source or Status column from the underlying PathEntry.
+
+    The model hands over the entry itself (UserRole) and the colors are
+    chosen here at paint time, so no per-cell color data is stored.
+    """
+
+    SOURCE = "source"
+    STATUS = "status"
+
+    def __init__(self, kind: str, parent=None):
+        super().__init__(parent)
+        self._kind = kind
+
+    def initStyleOption(self, option, index):
+        """Apply source/status colors on top of the default styling"""
+        super().initStyleOption(option, index)
+        entry = index.data(Qt.ItemDataRole.UserRole)
+        if entry is None:
+            return
+
+        if self._kind == self.SOURCE:
+            # Color code by source with strong contrast
+            if entry.source == "system":
+                option.backgroundBrush = _BRUSH_SYSTEM_BG
+                text_color = _CLR_SOURCE_FG
+            elif entry.source == "user":
+                option.backgroundBrush = _BRUSH_USER_BG
+                text_color = _CLR_SOURCE_FG
+            else:
+                # Environment (fallback)
+                text_color = _CLR_ENVIRONMENT_FG
+        else:
+            text_color = _CLR_OK if entry.exists else _CLR_BAD
+
+        palette = QPalette(option.palette)
+        palette.setColor(QPalette.ColorRole.Text, text_color)
+        option.palette = palette
+
 
 class PathManagerWindow(QMainWindow):
     """Main window for PathManager GUI"""
 
+    _settings = None  # QSettings shared by every window, see shared_settings()
+
     def __init__(self):
         super().__init__()
         self.analyzer = PathAnalyzer()
         self.search_matches = []  # List of matching row indices
         self.current_match_index = -1  # Current position in search results
-        self.settings = QSettings("PathManager", "PathManager")
+        self._last_search = None  # Text the current search_matches were computed for
+        self.settings = self.shared_settings()
+        self._dialogs = {}   # filename -> documentation dialog, built on first use
+
+        # Coalesce bursts of keystrokes into a single search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self.perform_search)
+
         self.init_ui()
 
+    @classmethod
+    def shared_settings(cls) -> QSettings:
+        """Return the application QSettings, creating it on first use"""
+        if cls._settings is None:
+            cls._settings = QSettings("PathManager", "PathManager")
+        return cls._settings
+
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("PathManager - PATH Environment Manager")
 
         # Restore window geometry from settings, or use default
         geometry = self.settings.value("geometry")
+        self._saved_geometry = geometry  # Compared on close to skip no-op writes
         if geometry:
             self.restoreGeometry(geometry)
         else:
@@ -62,25 +350,33 @@ class PathManagerWindow(QMainWindow):
         layout.addWidget(self.search_bar)
         self.search_bar.hide()
 
-        # Create table widget
-        self.table = QTableWidget()
+        # Create table view backed by the PATH model
+        self.table = QTableView()
+        self.model = PathTableModel(self.analyzer)
+        self.table.setModel(self.model)
+        self.source_delegate = PathItemDelegate(PathItemDelegate.SOURCE, self.table)
+        self.status_delegate = PathItemDelegate(PathItemDelegate.STATUS, self.table)
+        if self.model.column_for("Source") >= 0:
+            self.table.setItemDelegateForColumn(self.model.column_for("Source"), self.source_delegate)
+        self.table.setItemDelegateForColumn(self.model.column_for("Status"), self.status_delegate)
         self.setup_table()
         layout.addWidget(self.table)
 
-        # Populate table with PATH data
-        self.populate_table()
-
         # Create status bar
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
+
+        # Add subdued version datestamp on the right (created once, not per update)
+        self._version_label = QLabel("v0.2.0d 2026-01-09 1400 CST")
+        self._version_label.setObjectName("versionLabel")
+        self.statusBar.addPermanentWidget(self._version_label)
+
         self.update_status_bar()
 
     def create_header(self) -> QHBoxLayout:
         """Create system information header"""
         header_layout = QHBoxLayout()
 
-        info = self.analyzer.get_system_info()
-
         # Create labels for system info
         title_label = QLabel("PathManager")
         title_font = QFont()
@@ -88,9 +384,11 @@ class PathManagerWindow(QMainWindow):
         title_font.setBold(True)
         title_label.setFont(title_font)
 
-        info_text = f"{info['machine_name']} | {info['os_name']} {info['os_version']} | {info['hardware']}"
+        # Read analyzer attributes directly; the header never shows the timestamp
+        analyzer = self.analyzer
+        info_text = f"{analyzer.machine_name} | {analyzer.os_name} {analyzer.os_version} | {analyzer.hardware}"
         info_label = QLabel(info_text)
-        info_label.setStyleSheet("color: gray;")
+        info_label.setObjectName("systemInfo")
 
         header_layout.addWidget(title_label)
         header_layout.addStretch()
@@ -99,107 +397,48 @@ class PathManagerWindow(QMainWindow):
         return header_layout
 
     def create_search_bar(self) -> QFrame:
-        """Create the search bar widget"""
+        """Create the search bar widget (styled by _QSS via object names)"""
         search_frame = QFrame()
+        search_frame.setObjectName("searchBar")
         search_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-        search_frame.setStyleSheet("""
-            QFrame {
-                background-color: #e8e8e8;
-                padding: 5px;
-            }
-            QLabel {
-                color: #000000;
-            }
-        """)
 
         search_layout = QHBoxLayout(search_frame)
         search_layout.setContentsMargins(5, 5, 5, 5)
 
         # Search label
         search_label = QLabel("Find:")
-        search_label.setStyleSheet("color: #000000; font-weight: bold;")
+        search_label.setObjectName("searchLabel")
         search_layout.addWidget(search_label)
 
         # Search input
         self.search_input = QLineEdit()
+        self.search_input.setObjectName("searchInput")
         self.search_input.setPlaceholderText("Search PATH entries...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: white;
-                color: black;
-                border: 1px solid #cccccc;
-                padding: 5px;
-                border-radius: 3px;
-            }
-        """)
         self.search_input.returnPressed.connect(self.find_next)
-        self.search_input.textChanged.connect(self.perform_search)
+        self.search_input.textChanged.connect(self.schedule_search)
         search_layout.addWidget(self.search_input)
 
         # Match counter label
         self.match_label = QLabel("No matches")
-        self.match_label.setStyleSheet("color: #666666; margin-left: 10px;")
+        self.match_label.setObjectName("matchLabel")
         search_layout.addWidget(self.match_label)
 
         # Previous button
         prev_button = QPushButton("Previous")
-        prev_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        prev_button.setObjectName("navButton")
         prev_button.clicked.connect(self.find_previous)
         search_layout.addWidget(prev_button)
 
         # Next button
         next_button = QPushButton("Next")
-        next_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        next_button.setObjectName("navButton")
         next_button.clicked.connect(self.find_next)
         search_layout.addWidget(next_button)
 
         # Close button
         close_button = QPushButton("✕")
+        close_button.setObjectName("closeButton")
         close_button.setFixedWidth(30)
-        close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                padding: 5px;
-                border-radius: 3px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:pressed {
-                background-color: #c41408;
-            }
-        """)
         close_button.clicked.connect(self.hide_search_bar)
         search_layout.addWidget(close_button)
 
@@ -219,6 +458,12 @@ class PathManagerWindow(QMainWindow):
         find_action.triggered.connect(self.show_search_bar)
         file_menu.addAction(find_action)
 
+        refresh_action = QAction("&Refresh", self)
+        refresh_action.setShortcut("F5")
+        refresh_action.setStatusTip("Reload PATH entries from the system")
+        refresh_action.triggered.connect(self.refresh)
+        file_menu.addAction(refresh_action)
+
         file_menu.addSeparator()
 
         exit_action = QAction("E&xit", self)
@@ -299,18 +544,26 @@ class PathManagerWindow(QMainWindow):
 
     def show_overview(self):
         """Display the Overview documentation in a dialog"""
-        dialog = self.create_markdown_dialog("PathManager Overview", "README.md")
-        dialog.exec()
+        self.show_markdown_dialog("PathManager Overview", "README.md")
 
     def show_quick_reference(self):
         """Display the Quick Reference Guide in a dialog"""
-        dialog = self.create_markdown_dialog("Quick Reference Guide", "QUICK_REFERENCE.md")
-        dialog.exec()
+        self.show_markdown_dialog("Quick Reference Guide", "QUICK_REFERENCE.md")
 
     def show_changelog(self):
         """Display the Change Log in a dialog"""
-        dialog = self.create_markdown_dialog("Change Log", "CHANGELOG.md")
-        dialog.exec()
+        self.show_markdown_dialog("Change Log", "CHANGELOG.md")
+
+    def show_markdown_dialog(self, title: str, filename: str):
+        """Show a documentation dialog, reusing it if it was opened before"""
+        dialog = self._dialogs.get(filename)
+        if dialog is None:
+            dialog = self.create_markdown_dialog(title, filename)
+            self._dialogs[filename] = dialog
+        # Non-modal so the main window stays usable while reading the docs
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
 
     def is_dark_theme(self) -> bool:
         """Detect if the system is using dark theme"""
@@ -359,17 +612,14 @@ class PathManagerWindow(QMainWindow):
         text_widget.setReadOnly(True)
         
         # Try to load the markdown file
+        file_path = os.path.join(_PROJECT_ROOT, filename)
         try:
-            # Get the project root directory (where pathmanager.py is)
-            current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            file_path = os.path.join(current_dir, filename)
-            
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    text_widget.setMarkdown(content)
-            else:
-                text_widget.setPlainText(f"Error: Could not find {filename}\n\nExpected location: {file_path}")
+            # Binary read + decode skips text-mode newline translation
+            with open(file_path, 'rb') as f:
+                content = f.read().decode('utf-8')
+            text_widget.setMarkdown(content)
+        except FileNotFoundError:
+            text_widget.setPlainText(f"Error: Could not find {filename}\n\nExpected location: {file_path}")
         except Exception as e:
             text_widget.setPlainText(f"Error reading {filename}: {str(e)}")
         
@@ -527,105 +777,72 @@ class PathManagerWindow(QMainWindow):
         return dialog
 
     def setup_table(self):
-        """Set up the table widget structure"""
-        # Define columns
-        if self.analyzer.is_windows():
-            columns = ["#", "Path", "Source", "Status"]
-        else:
-            columns = ["#", "Path", "Status"]
-
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
-
+        """Set up the table view properties"""
         # Set table properties
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
 
         # Set column widths
+        # The short columns get a fixed width from their widest possible text;
+        # ResizeToContents would format and measure every row to size them
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # #
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)  # #
+        header.resizeSection(0, self.column_width("#", str(self.model.rowCount())))
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Path
         if self.analyzer.is_windows():
-            header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Source
-            header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Status
+            header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)  # Source
+            header.resizeSection(2, self.column_width("Source", "Environment"))
+            header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)  # Status
+            header.resizeSection(3, self.column_width("Status", "✗ Not Found"))
         else:
-            header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Status
-
-    def populate_table(self):
-        """Populate table with PATH entries"""
-        entries = self.analyzer.get_path_entries()
-        self.table.setRowCount(len(entries))
-
-        for row, entry in enumerate(entries):
-            # Column 0: Index
-            index_item = QTableWidgetItem(str(entry.index + 1))
-            index_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 0, index_item)
-
-            # Column 1: Path
-            path_item = QTableWidgetItem(entry.path)
-            self.table.setItem(row, 1, path_item)
-
-            # Column 2: Source (Windows) or Status (Unix)
-            if self.analyzer.is_windows():
-                source_item = QTableWidgetItem(entry.source.capitalize())
-                source_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-                # Color code by source with strong contrast
-                if entry.source == "system":
-                    source_item.setBackground(QColor(0, 60, 120))     # Dark blue background
-                    source_item.setForeground(QColor(245, 245, 250))  # Off-white text
-                elif entry.source == "user":
-                    source_item.setBackground(QColor(0, 100, 0))      # Dark green background
-                    source_item.setForeground(QColor(245, 245, 250))  # Off-white text
-                else:
-                    # Environment (fallback)
-                    source_item.setForeground(QColor(160, 160, 160))  # Light gray text
-
-                self.table.setItem(row, 2, source_item)
-
-                # Column 3: Status
-                status_item = self.create_status_item(entry)
-                self.table.setItem(row, 3, status_item)
-            else:
-                # Column 2: Status
-                status_item = self.create_status_item(entry)
-                self.table.setItem(row, 2, status_item)
-
-    def create_status_item(self, entry) -> QTableWidgetItem:
-        """Create a status table item for a PATH entry"""
-        if entry.exists:
-            status_item = QTableWidgetItem("✓ OK")
-            status_item.setForeground(QColor(0, 128, 0))  # Green
-        else:
-            status_item = QTableWidgetItem("✗ Not Found")
-            status_item.setForeground(QColor(255, 0, 0))  # Red
+            header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)  # Status
+            header.resizeSection(2, self.column_width("Status", "✗ Not Found"))
 
-        status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        return status_item
+    def column_width(self, title: str, widest_text: str) -> int:
+        """Width that fits a column's title and its widest cell text"""
+        padding = 24
+        header_width = self.table.horizontalHeader().fontMetrics().horizontalAdvance(title)
+        cell_width = self.table.fontMetrics().horizontalAdvance(widest_text)
+        return max(header_width, cell_width) + padding
 
     def update_status_bar(self):
         """Update status bar with summary information"""
         total = self.analyzer.get_entry_count()
-        missing = sum(1 for entry in self.analyzer.get_path_entries() if not entry.exists)
+        missing = self.model.missing_count()
 
-        status_text = f"Total entries: {total}"
+        parts = [f"Total entries: {total}"]
 
         if self.analyzer.is_windows():
             user_count = len(self.analyzer.get_user_path())
             system_count = len(self.analyzer.get_system_path())
-            status_text += f" | User: {user_count} | System: {system_count}"
+            parts.append(f"User: {user_count}")
+            parts.append(f"System: {system_count}")
 
         if missing > 0:
-            status_text += f" | Missing directories: {missing}"
+            parts.append(f"Missing directories: {missing}")
 
-        self.statusBar.showMessage(status_text)
+        self.statusBar.showMessage(" | ".join(parts))
 
-        # Add subdued version datestamp on the right
-        version_label = QLabel("v0.2.0d 2026-01-09 1400 CST")
-        version_label.setStyleSheet("color: #888888; font-size: 9pt;")
-        self.statusBar.addPermanentWidget(version_label)
+    def refresh(self):
+        """Reload PATH data from the system and rebuild the table"""
+        self.analyzer.refresh()
+
+        # Repaint once after the reset and column resizing, not per step
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_entries(self.analyzer.get_path_entries())
+            self.setup_table()
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self.update_status_bar()
+
+        # The model reset dropped highlights; re-run any active search
+        self.search_matches = []
+        self.current_match_index = -1
+        self._last_search = None
+        if not self.search_bar.isHidden():
+            self.perform_search()
 
     def show_search_bar(self):
         """Show the search bar and focus the input"""
@@ -635,6 +852,8 @@ class PathManagerWindow(QMainWindow):
 
     def hide_search_bar(self):
         """Hide the search bar and clear highlights"""
+        self._search_timer.stop()
+        self._last_search = None
         self.search_bar.hide()
         self.clear_search_highlights()
         self.search_matches = []
@@ -643,40 +862,41 @@ class PathManagerWindow(QMainWindow):
 
     def clear_search_highlights(self):
         """Clear search highlighting from the Path column only"""
-        path_column = 1
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, path_column)
-            if item:
-                # Clear background and foreground from Path column (use Qt default)
-                item.setData(Qt.ItemDataRole.BackgroundRole, None)
-                item.setData(Qt.ItemDataRole.ForegroundRole, None)
+        self.model.set_search_matches([])
+
+    def schedule_search(self):
+        """Restart the debounce timer; the search runs once typing pauses"""
+        self._search_timer.start(SEARCH_DEBOUNCE_MS)
+
+    def flush_pending_search(self):
+        """Run a scheduled search now so navigation sees current results"""
+        if self._search_timer.isActive():
+            self._search_timer.stop()
+            self.perform_search()
 
     def perform_search(self):
-        """Perform search as text is typed"""
+        """Perform search on the current search text"""
         search_text = self.search_input.text().strip()
 
-        # Clear previous highlights and current match indicator
-        self.clear_search_highlights()
-        self.clear_current_match_indicator()
-        self.search_matches = []
+        # Nothing to do if the text didn't actually change (e.g. IME commits)
+        if search_text == self._last_search:
+            return
+        self._last_search = search_text
+
         self.current_match_index = -1
 
+        # Search only in Path column - case-insensitive
+        self.search_matches = self.model.find_rows(search_text) if search_text else []
+
+        # Highlight matching path cells with medium grey background and white text.
+        # This also drops the previous highlights and current match indicator,
+        # repainting only the rows whose highlight actually changed.
+        self.model.set_search_matches(self.search_matches)
+
         if not search_text:
             self.match_label.setText("No matches")
             return
 
-        # Search only in Path column (column 1) - case-insensitive
-        search_lower = search_text.lower()
-        path_column = 1
-
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, path_column)
-            if item and search_lower in item.text().lower():
-                # Highlight matching path cell with medium grey background and white text
-                item.setBackground(QColor(128, 128, 128))  # Medium grey background
-                item.setForeground(QColor(255, 255, 255))  # White text
-                self.search_matches.append(row)
-
         # Update match counter
         if self.search_matches:
             self.match_label.setText(f"{len(self.search_matches)} matches")
@@ -690,33 +910,24 @@ class PathManagerWindow(QMainWindow):
         if not self.search_matches or self.current_match_index < 0:
             return
 
-        path_column = 1
-        row = self.search_matches[self.current_match_index]
-        item = self.table.item(row, path_column)
-        if item:
-            # Return to regular medium grey highlight with white text
-            item.setBackground(QColor(128, 128, 128))  # Medium grey background
-            item.setForeground(QColor(255, 255, 255))  # White text
+        # Return to regular medium grey highlight with white text
+        self.model.set_current_match(-1)
 
     def highlight_current_match(self):
         """Highlight the current match and scroll to it"""
         if not self.search_matches or self.current_match_index < 0:
             return
 
-        path_column = 1
         row = self.search_matches[self.current_match_index]
 
         # Clear any existing row selection
         self.table.clearSelection()
 
         # Make the current match stand out with a darker grey background
-        item = self.table.item(row, path_column)
-        if item:
-            item.setBackground(QColor(80, 80, 80))    # Dark grey background for current match
-            item.setForeground(QColor(255, 255, 255))  # White text
+        self.model.set_current_match(row)
 
         # Scroll to the row
-        self.table.scrollToItem(item)
+        self.table.scrollTo(self.model.index(row, PathTableModel.PATH_COLUMN))
 
         # Update match label with position
         self.match_label.setText(
@@ -725,6 +936,7 @@ class PathManagerWindow(QMainWindow):
 
     def find_next(self):
         """Navigate to the next search match"""
+        self.flush_pending_search()
         if not self.search_matches:
             return
 
@@ -736,6 +948,7 @@ class PathManagerWindow(QMainWindow):
 
     def find_previous(self):
         """Navigate to the previous search match"""
+        self.flush_pending_search()
         if not self.search_matches:
             return
 
@@ -747,6 +960,10 @@ class PathManagerWindow(QMainWindow):
 
     def handle_quit_shortcut(self):
         """Handle Q key press to quit - but not when typing in search"""
+        # The shortcut is application-wide, so ignore it while a non-modal
+        # Help dialog is the active window
+        if QApplication.activeWindow() is not self:
+            return
         # Don't quit if the search input field has focus (user is typing)
         if self.search_input.hasFocus():
             # Let the Q key go through to the search field
@@ -756,7 +973,10 @@ class PathManagerWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Save window geometry when closing"""
-        self.settings.setValue("geometry", self.saveGeometry())
+        geometry = self.saveGeometry()
+        if geometry != self._saved_geometry:
+            self.settings.setValue("geometry", geometry)
+            self._saved_geometry = geometry
         event.accept()
 
 
@@ -764,6 +984,7 @@ def run_gui():
     """Run the GUI version of PathManager"""
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Modern look across platforms
+    app.setStyleSheet(_QSS)
 
     window = PathManagerWindow()
     window.show()
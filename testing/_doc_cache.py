@@ -0,0 +1,17 @@
+"""
+Shared, memoized file reader for the test scripts
+"""
+
+import functools
+import pathlib
+
+
+@functools.lru_cache(maxsize=16)
+def read_bytes(path):
+    """Read a file once per process and return its undecoded bytes"""
+    return pathlib.Path(path).read_bytes()
+
+
+def read_doc(path):
+    """Return the text of a documentation file, read through read_bytes()"""
+    return read_bytes(path).decode('utf-8')
@@ -0,0 +1,26 @@
+"""
+Shared, memoized views of gui/gui_main.py for the version and method checks
+"""
+
+import ast
+import functools
+import pathlib
+
+from _doc_cache import read_bytes
+
+GUI_MAIN = pathlib.Path(__file__).resolve().parent.parent / 'gui' / 'gui_main.py'
+
+
+def gui_bytes():
+    """Return the undecoded bytes of gui/gui_main.py, read once per process"""
+    return read_bytes(GUI_MAIN)
+
+
+@functools.lru_cache(maxsize=None)
+def gui_class_methods(class_name):
+    """Return the names of the methods defined in a gui_main.py class, without importing it"""
+    tree = ast.parse(gui_bytes(), filename=str(GUI_MAIN))
+    cls = next(node for node in tree.body
+               if isinstance(node, ast.ClassDef) and node.name == class_name)
+    return frozenset(node.name for node in cls.body
+                     if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)))
@@ -0,0 +1,15 @@
+"""
+One-time import path setup for the PathManager test scripts
+
+Importing this module puts the project root on sys.path, so the project
+packages (core, gui, cli) resolve when a script is run directly
+(python testing/<script>.py) as well as under pytest.
+"""
+
+import pathlib
+import sys
+
+PROJECT_ROOT = str(pathlib.Path(__file__).resolve().parent.parent)
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
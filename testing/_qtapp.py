@@ -0,0 +1,11 @@
+"""
+Process-wide QApplication shared by the GUI test scripts
+"""
+
+import sys
+
+
+def qapp():
+    """Return the running QApplication, creating it on first use"""
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv)
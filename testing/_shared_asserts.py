@@ -0,0 +1,38 @@
+"""
+Shared assertion helpers for the PathManager test scripts
+"""
+
+import os
+
+from _doc_cache import read_doc
+
+# Documentation files the Help menu opens, with a string each must contain
+HELP_DOCS = (
+    ('QUICK_REFERENCE.md', 'PathManager'),
+    ('CHANGELOG.md', '0.2.0a'),
+)
+
+
+def assert_found(content, checks):
+    """
+    Assert that content contains every needle in checks, failing once for all misses.
+
+    checks is a sequence of (needle, message) pairs; the AssertionError
+    lists the message of every missing needle.
+    """
+    missing = [message for needle, message in checks if needle not in content]
+    assert not missing, "; ".join(missing)
+
+
+def assert_docs_accessible(mark="OK:"):
+    """
+    Assert that each Help menu document is readable and has real content.
+
+    Prints one line per document, prefixed with mark, as each one passes.
+    """
+    for filename, expected in HELP_DOCS:
+        # Size check is a single stat; a truncated doc fails without being read
+        assert os.stat(filename).st_size > 100, f"{filename} seems too short"
+        content = read_doc(filename)
+        assert expected in content, f"{filename} doesn't contain {expected}"
+        print(f"{mark} {filename} is accessible and contains content")
@@ -0,0 +1,5 @@
+"""
+pytest configuration for the PathManager test scripts
+"""
+
+import _paths  # noqa: F401  (puts the project root on sys.path)
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Quick test to verify GUI version updates"""
 
+import _paths  # noqa: F401  (puts the project root on sys.path)
+
 def test_gui_imports():
     try:
-        import sys
-        sys.path.append('.')
         import core
         import gui.gui_main
         
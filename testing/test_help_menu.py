@@ -3,27 +3,40 @@
 Test script to verify Help menu functionality in PathManager GUI
 """
 
+import importlib.util
 import sys
-import os
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import _paths  # noqa: F401  (puts the project root on sys.path)
+from _shared_asserts import assert_docs_accessible
+from _gui_scan import gui_class_methods
+from _qtapp import qapp
 
-def test_help_menu_methods():
-    """Test if the Help menu methods are properly defined"""
+# Checked without importing, so file-access-only runs never load Qt
+_HAS_QT = importlib.util.find_spec('PyQt6') is not None
+
+def test_help_methods_defined():
+    """Test if the Help menu methods are defined, by parsing gui_main.py (no Qt needed)"""
     try:
-        from gui.gui_main import PathManagerWindow
-        window = PathManagerWindow()
-        
-        # Check if methods exist
-        methods = dir(window)
+        methods = gui_class_methods('PathManagerWindow')
         assert 'show_quick_reference' in methods, "show_quick_reference method not found"
         assert 'show_changelog' in methods, "show_changelog method not found"
         assert 'create_markdown_dialog' in methods, "create_markdown_dialog method not found"
         
         print("✓ All Help menu methods are properly defined")
+        return True
         
-        # Test markdown dialog creation (without showing)
+    except Exception as e:
+        print(f"✗ Error checking Help menu methods: {e}")
+        return False
+
+def test_help_menu_methods():
+    """Test if the Help menu methods work on a real window"""
+    try:
+        from gui.gui_main import PathManagerWindow
+        
+        # Test markdown dialog creation (without showing); reuse any existing app
+        app = qapp()
+        window = PathManagerWindow()
         dialog = window.create_markdown_dialog("Test", "QUICK_REFERENCE.md")
         assert dialog is not None, "create_markdown_dialog returned None"
         
@@ -38,19 +51,7 @@ def test_help_menu_methods():
 def test_file_access():
     """Test if documentation files are accessible"""
     try:
-        # Test QUICK_REFERENCE.md
-        with open('QUICK_REFERENCE.md', 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert len(content) > 100, "QUICK_REFERENCE.md seems too short"
-            assert "PathManager" in content, "QUICK_REFERENCE.md doesn't contain PathManager"
-        print("✓ QUICK_REFERENCE.md is accessible and contains content")
-        
-        # Test CHANGELOG.md
-        with open('CHANGELOG.md', 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert len(content) > 100, "CHANGELOG.md seems too short"
-            assert "0.2.0a" in content, "CHANGELOG.md doesn't contain version 0.2.0a"
-        print("✓ CHANGELOG.md is accessible and contains content")
+        assert_docs_accessible("✓")
         
         return True
         
@@ -69,13 +70,21 @@ def main():
     if not test_file_access():
         success = False
     
+    # Test Help menu method definitions (no PyQt6 required)
+    if not test_help_methods_defined():
+        success = False
+    
     # Test Help menu methods (this might fail if PyQt6 is not available)
-    try:
-        if not test_help_menu_methods():
-            success = False
-    except ImportError as e:
-        print(f"⚠ PyQt6 not available for GUI testing: {e}")
+    if not _HAS_QT:
+        print("⚠ PyQt6 not available for GUI testing")
         print("  This is expected in environments without GUI support")
+    else:
+        try:
+            if not test_help_menu_methods():
+                success = False
+        except ImportError as e:
+            print(f"⚠ PyQt6 not available for GUI testing: {e}")
+            print("  This is expected in environments without GUI support")
     
     print("=" * 50)
     if success:
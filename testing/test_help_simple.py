@@ -3,22 +3,13 @@
 Simple test to verify documentation files are accessible
 """
 
+import _paths  # noqa: F401  (puts the project root on sys.path)
+from _shared_asserts import assert_docs_accessible
+
 def test_file_access():
     """Test if documentation files are accessible"""
     try:
-        # Test QUICK_REFERENCE.md
-        with open('QUICK_REFERENCE.md', 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert len(content) > 100, "QUICK_REFERENCE.md seems too short"
-            assert "PathManager" in content, "QUICK_REFERENCE.md doesn't contain PathManager"
-        print("OK: QUICK_REFERENCE.md is accessible and contains content")
-        
-        # Test CHANGELOG.md
-        with open('CHANGELOG.md', 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert len(content) > 100, "CHANGELOG.md seems too short"
-            assert "0.2.0a" in content, "CHANGELOG.md doesn't contain version 0.2.0a"
-        print("OK: CHANGELOG.md is accessible and contains content")
+        assert_docs_accessible()
         
         return True
         
@@ -29,17 +20,12 @@ def test_file_access():
 def test_gui_code():
     """Test if GUI code has been new methods without creating widgets"""
     try:
-        import sys
-        import os
-        sys.path.append('.')
-        
         # Just import module to check for syntax errors
         from gui import gui_main
         print("OK: GUI module imports successfully")
         
-        # Check if methods exist in class definition
-        import inspect
-        methods = [name for name, method in inspect.getmembers(gui_main.PathManagerWindow, predicate=inspect.isfunction)]
+        # Check if methods exist in class definition (own namespace, no MRO walk)
+        methods = vars(gui_main.PathManagerWindow).keys()
         
         assert 'show_quick_reference' in methods, "show_quick_reference method not found"
         assert 'show_changelog' in methods, "show_changelog method not found" 
@@ -3,19 +3,20 @@
 Test script to verify GUI updates work correctly
 """
 
-import sys
-import os
-sys.path.append('.')
+import _paths  # noqa: F401  (puts the project root on sys.path)
+from _doc_cache import read_doc
+from _gui_scan import gui_bytes
+from _shared_asserts import assert_found
 
 def test_version_updates():
     """Test that version has been updated in GUI code"""
     try:
         from gui.gui_main import PathManagerWindow
-        with open('gui/gui_main.py', 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        assert 'v0.2.0a' in content, "Version not updated in GUI code"
-        assert 'Version:</b> v0.2.0a' in content, "About dialog version not updated"
+        checks = (
+            (b'v0.2.0a', "Version not updated in GUI code"),
+            (b'Version:</b> v0.2.0a', "About dialog version not updated"),
+        )
+        assert_found(gui_bytes(), checks)
         print("OK: Version updated to v0.2.0a in GUI")
         
         return True
@@ -26,11 +27,12 @@ def test_version_updates():
 def test_changelog_update():
     """Test that CHANGELOG has been updated"""
     try:
-        with open('CHANGELOG.md', 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_doc('CHANGELOG.md')
             
-        assert 'Quick Reference Guide' in content, "Quick Reference not added to CHANGELOG"
-        assert 'Help menu items' in content, "Help menu not mentioned in CHANGELOG"
+        assert_found(content, (
+            ('Quick Reference Guide', "Quick Reference not added to CHANGELOG"),
+            ('Help menu items', "Help menu not mentioned in CHANGELOG"),
+        ))
         assert 'v0.2.0a' not in content or 'Unreleased' in content, "Should be in Unreleased section"
         print("OK: CHANGELOG updated with new features")
         
@@ -3,20 +3,47 @@
 Test script to verify theme detection works for PathManager GUI dialogs
 """
 
+import functools
+import importlib.util
 import platform
 import sys
 import os
 
+try:
+    import winreg
+except ImportError:  # not on Windows
+    winreg = None
+
+from _qtapp import qapp
+
+# Checked without importing, so runs without PyQt6 never touch Qt
+_HAS_QT = importlib.util.find_spec('PyQt6') is not None
+
+# Values read from the Personalize key (1 = light, 0 = dark)
+_PERSONALIZE_VALUES = ("AppsUseLightTheme", "SystemUsesLightTheme")
+
+def _query_optional(key, name):
+    """Return a registry value, or None if it is not set (e.g. older Windows 10 builds)"""
+    try:
+        return winreg.QueryValueEx(key, name)[0]
+    except FileNotFoundError:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _read_personalize():
+    """Read all Personalize theme values with a single key open; missing ones are None"""
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
+                      r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize") as key:
+        return {name: _query_optional(key, name) for name in _PERSONALIZE_VALUES}
+
 def is_dark_theme_fallback():
     """Fallback theme detection using Windows registry"""
     if platform.system() == "Windows":
         try:
-            import winreg
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                              r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize") as key:
-                # 0 = light, 1 = dark
-                apps_use_light_theme, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-                return apps_use_light_theme == 0
+            apps_use_light_theme = _read_personalize()["AppsUseLightTheme"]
+            if apps_use_light_theme is None:
+                raise FileNotFoundError("AppsUseLightTheme is not set")
+            return apps_use_light_theme == 0
         except Exception as e:
             print(f"Registry check failed: {e}")
             pass
@@ -24,27 +51,33 @@ def is_dark_theme_fallback():
 
 def test_qt_theme_detection():
     """Test Qt-based theme detection"""
+    if not _HAS_QT:
+        print('PyQt6 not available - using fallback detection')
+        return None
     try:
-        from PyQt6.QtWidgets import QApplication
         from PyQt6.QtGui import QPalette
         
-        app = QApplication([])
+        app = qapp()
         palette = app.palette()
-        window_color = palette.color(QPalette.ColorRole.Window)
-        window_text_color = palette.color(QPalette.ColorRole.WindowText)
-        print(f'Window color RGB: ({window_color.red()}, {window_color.green()}, {window_color.blue()})')
-        print(f'Window text color RGB: ({window_text_color.red()}, {window_text_color.green()}, {window_text_color.blue()})')
+        # One getRgb() call per color instead of red()/green()/blue() each
+        window_rgb = palette.color(QPalette.ColorRole.Window).getRgb()[:3]
+        window_text_rgb = palette.color(QPalette.ColorRole.WindowText).getRgb()[:3]
+        print(f'Window color RGB: {window_rgb}')
+        print(f'Window text color RGB: {window_text_rgb}')
         
-        # Calculate luminance
-        def get_luminance(color):
-            return (0.299 * color.red() + 0.587 * color.green() + 0.114 * color.blue()) / 255
+        # Integer Rec. 601 luminance (scaled by 1000 * 255); the scale
+        # cancels out in the comparison and is only divided out for display
+        def get_luminance(rgb):
+            r, g, b = rgb
+            return 299 * r + 587 * g + 114 * b
         
-        bg_luminance = get_luminance(window_color)
-        text_luminance = get_luminance(window_text_color)
-        print(f'Background luminance: {bg_luminance:.2f}')
-        print(f'Text luminance: {text_luminance:.2f}')
-        print(f'Dark theme detected: {bg_luminance < text_luminance}')
-        return bg_luminance < text_luminance
+        bg_luminance = get_luminance(window_rgb)
+        text_luminance = get_luminance(window_text_rgb)
+        is_dark = bg_luminance < text_luminance
+        print(f'Background luminance: {bg_luminance / 255000:.2f}')
+        print(f'Text luminance: {text_luminance / 255000:.2f}')
+        print(f'Dark theme detected: {is_dark}')
+        return is_dark
     except ImportError:
         print('PyQt6 not available - using fallback detection')
         return None
@@ -58,34 +91,39 @@ if __name__ == "__main__":
     print(f"Platform: {platform.platform()}")
     print()
     
-    # Test Qt-based detection (if available)
-    qt_result = test_qt_theme_detection()
-    print()
+    # Test Qt-based detection (if available). Its result is only compared
+    # against the registry on Windows, so elsewhere it runs only on request
+    is_windows = platform.system() == "Windows"
+    probe_qt = is_windows or "--qt" in sys.argv[1:]
+    qt_result = None
+    if probe_qt:
+        qt_result = test_qt_theme_detection()
+        print()
     
     # Test Windows registry detection
-    if platform.system() == "Windows":
+    if is_windows:
         dark_theme_registry = is_dark_theme_fallback()
         print(f"Windows registry dark theme detected: {dark_theme_registry}")
         
         # Also check system theme via registry if available
         try:
-            import winreg
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                              r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize") as key:
-                apps_use_light_theme, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-                system_use_light_theme, _ = winreg.QueryValueEx(key, "SystemUsesLightTheme")
-                print(f"Apps use light theme: {apps_use_light_theme == 1}")
-                print(f"System uses light theme: {system_use_light_theme == 1}")
-                
-                # Compare methods
-                if qt_result is not None:
-                    print(f"\nDetection method comparison:")
-                    print(f"  Qt palette method: {'DARK' if qt_result else 'LIGHT'}")
-                    print(f"  Registry method:   {'DARK' if dark_theme_registry else 'LIGHT'}")
-                    print(f"  Methods agree: {qt_result == dark_theme_registry}")
+            values = _read_personalize()
+            for name, label in (("AppsUseLightTheme", "Apps use light theme"),
+                                ("SystemUsesLightTheme", "System uses light theme")):
+                value = values[name]
+                print(f"{label}: {'not set' if value is None else value == 1}")
+            
+            # Compare methods
+            if qt_result is not None:
+                print(f"\nDetection method comparison:")
+                print(f"  Qt palette method: {'DARK' if qt_result else 'LIGHT'}")
+                print(f"  Registry method:   {'DARK' if dark_theme_registry else 'LIGHT'}")
+                print(f"  Methods agree: {qt_result == dark_theme_registry}")
         except Exception as e:
             print(f"Could not read theme registry: {e}")
     else:
         print("Non-Windows system - PyQt6 palette detection would be used")
+        if not probe_qt:
+            print("(run with --qt to probe the Qt palette)")
     
     print("\n=== Test Completed ===")
\ No newline at end of file
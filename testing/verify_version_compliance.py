@@ -3,15 +3,46 @@
 Verify version updates comply with Project_Rules.md
 """
 
+import os
+
+from _doc_cache import read_bytes
+from _gui_scan import gui_bytes
+from _shared_asserts import assert_found
+
+# Expected version strings, grouped per file with their failure messages
+CHANGELOG_VERSION = b'## [0.2.0a] - Thu 08 Jan 2026 11:32:00 AM CST'
+GUI_STATUS_VERSION = b'v0.2.0a 2026-01-08 1132 CST'
+GUI_ABOUT_VERSION = b'Version:</b> v0.2.0a'
+HEADER_VERSION = b'Version: v0.2.0a 2026-01-08 1132 CST'
+ARGUMENT_VERSION = b'version="PathManager v0.2.0a 2026-01-08 1132 CST"'
+CORE_VERSION = b'__version__ = "0.2.0a"'
+TIMEZONE = b'CST'
+
+CHANGELOG_CHECKS = (
+    (CHANGELOG_VERSION, "Version format incorrect in CHANGELOG"),
+    (TIMEZONE, "Timezone indicator missing from CHANGELOG"),
+)
+GUI_CHECKS = (
+    (GUI_STATUS_VERSION, "Status bar version format incorrect"),
+    (GUI_ABOUT_VERSION, "About dialog version format incorrect"),
+)
+ENTRY_POINT_CHECKS = (
+    (HEADER_VERSION, "Header version format incorrect"),
+    (ARGUMENT_VERSION, "Argument version format incorrect"),
+)
+CORE_CHECKS = (
+    (CORE_VERSION, "Core version format incorrect"),
+)
+
+def check_file(path, checks):
+    """Check the cached bytes of path for every needle in checks"""
+    assert_found(read_bytes(path), checks)
+
 def test_changelog_format():
     """Test CHANGELOG follows correct format"""
     try:
-        with open('CHANGELOG.md', 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         # Check for proper version format
-        assert '## [0.2.0a] - Thu 08 Jan 2026 11:32:00 AM CST' in content, "Version format incorrect in CHANGELOG"
-        assert 'CST' in content, "Timezone indicator missing from CHANGELOG"
+        check_file('CHANGELOG.md', CHANGELOG_CHECKS)
         
         print("OK: CHANGELOG version format follows Project_Rules.md")
         return True
@@ -22,12 +53,8 @@ def test_changelog_format():
 def test_gui_version_format():
     """Test GUI version format"""
     try:
-        with open('gui/gui_main.py', 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Check status bar version
-        assert 'v0.2.0a 2026-01-08 1132 CST' in content, "Status bar version format incorrect"
-        assert 'Version:</b> v0.2.0a' in content, "About dialog version format incorrect"
+        # Check status bar and About dialog versions
+        assert_found(gui_bytes(), GUI_CHECKS)
         
         print("OK: GUI version format follows Project_Rules.md")
         return True
@@ -38,12 +65,8 @@ def test_gui_version_format():
 def test_entry_point_version():
     """Test main entry point version"""
     try:
-        with open('pathmanager.py', 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         # Check header comment and argument version
-        assert 'Version: v0.2.0a 2026-01-08 1132 CST' in content, "Header version format incorrect"
-        assert 'version="PathManager v0.2.0a 2026-01-08 1132 CST"' in content, "Argument version format incorrect"
+        check_file('pathmanager.py', ENTRY_POINT_CHECKS)
         
         print("OK: Entry point version format follows Project_Rules.md")
         return True
@@ -54,10 +77,7 @@ def test_entry_point_version():
 def test_core_version():
     """Test core module version"""
     try:
-        with open('core/__init__.py', 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        assert '__version__ = "0.2.0a"' in content, "Core version format incorrect"
+        check_file('core/__init__.py', CORE_CHECKS)
         
         print("OK: Core module version updated")
         return True
@@ -69,16 +89,17 @@ def main():
     print("Verifying Version Updates Compliance with Project_Rules.md")
     print("=" * 60)
     
-    success = True
+    # FAIL_FAST=1 stops at the first failing check (usually the root cause)
+    fail_fast = os.environ.get('FAIL_FAST', '') not in ('', '0')
+    tests = (test_changelog_format, test_gui_version_format,
+             test_entry_point_version, test_core_version)
     
-    if not test_changelog_format():
-        success = False
-    if not test_gui_version_format():
-        success = False
-    if not test_entry_point_version():
-        success = False
-    if not test_core_version():
-        success = False
+    success = True
+    for test in tests:
+        if not test():
+            success = False
+            if fail_fast:
+                break
     
     print("=" * 60)
     if success: